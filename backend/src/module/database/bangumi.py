@@ -1,4 +1,7 @@
 import logging
+import re
+import sqlite3
+from typing import Iterator, get_origin
 
 from module.database.connector import DataConnector
 from module.models import BangumiData
@@ -6,6 +9,28 @@ from module.ab_decorator import locked
 
 logger = logging.getLogger(__name__)
 
+BOOL_FIELDS = frozenset(
+    key for key, field in BangumiData.__fields__.items() if field.outer_type_ is bool
+)
+LIST_FIELDS = frozenset(
+    key
+    for key, field in BangumiData.__fields__.items()
+    if get_origin(field.outer_type_) is list
+)
+
+# Rows pulled per fetchmany() when streaming the table
+FETCH_SIZE = 1000
+
+COLUMNS = list(BangumiData.__fields__)
+INSERT_SQL = (
+    f"INSERT INTO bangumi ({', '.join(COLUMNS)}) "
+    f"VALUES ({', '.join(f':{key}' for key in COLUMNS)})"
+)
+UPDATE_SQL = (
+    f"UPDATE bangumi SET {', '.join(f'{key} = :{key}' for key in COLUMNS if key != 'id')} "
+    f"WHERE id = :id"
+)
+
 
 class BangumiDatabase(DataConnector):
     def __init__(self):
@@ -15,34 +40,42 @@ class BangumiDatabase(DataConnector):
     def update_table(self):
         db_data = self.__data_to_db(BangumiData())
         self._update_table(self.__table_name, db_data)
+        self._cursor.execute("CREATE INDEX IF NOT EXISTS idx_bangumi_id ON bangumi(id)")
+        self._cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_bangumi_title_raw ON bangumi(title_raw)"
+        )
+        self._cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_bangumi_official_title "
+            "ON bangumi(official_title)"
+        )
+        self._commit()
 
     @staticmethod
     def __data_to_db(data: BangumiData) -> dict:
         db_data = data.dict()
-        for key, value in db_data.items():
-            if isinstance(value, bool):
-                db_data[key] = int(value)
-            elif isinstance(value, list):
-                db_data[key] = ",".join(value)
+        for key in BOOL_FIELDS:
+            db_data[key] = int(db_data[key])
+        for key in LIST_FIELDS:
+            db_data[key] = ",".join(db_data[key])
         return db_data
 
     @staticmethod
     def __db_to_data(db_data: dict) -> BangumiData:
-        for key, item in db_data.items():
-            if isinstance(item, int):
-                if key not in ["id", "offset", "season", "year"]:
-                    db_data[key] = bool(item)
-            elif key in ["filter", "rss_link"]:
-                db_data[key] = item.split(",")
+        for key in BOOL_FIELDS:
+            if db_data.get(key) is not None:
+                db_data[key] = bool(db_data[key])
+        for key in LIST_FIELDS:
+            if db_data.get(key) is not None:
+                db_data[key] = db_data[key].split(",")
         return BangumiData(**db_data)
 
     def __fetch_data(self) -> list[BangumiData]:
-        values = self._cursor.fetchall()
-        if values is None:
-            return []
-        keys = [x[0] for x in self._cursor.description]
-        dict_data = [dict(zip(keys, value)) for value in values]
-        return [self.__db_to_data(x) for x in dict_data]
+        return [self.__db_to_data(dict(row)) for row in self._cursor.fetchall()]
+
+    def __iter_data(self, cursor: sqlite3.Cursor) -> Iterator[BangumiData]:
+        while rows := cursor.fetchmany():
+            for row in rows:
+                yield self.__db_to_data(dict(row))
 
     def insert(self, data: BangumiData):
         if self.__check_exist(data):
@@ -50,24 +83,27 @@ class BangumiDatabase(DataConnector):
         else:
             db_data = self.__data_to_db(data)
             db_data["id"] = self.gen_id()
-            self._insert(db_data=db_data, table_name=self.__table_name)
+            self._cursor.execute(INSERT_SQL, db_data)
+            self._commit()
             logger.debug(f"[Database] Insert {data.official_title} into database.")
 
     def insert_list(self, data: list[BangumiData]):
         _id = self.gen_id()
         for i, item in enumerate(data):
             item.id = _id + i
-        data_list = [self.__data_to_db(x) for x in data]
-        self._insert_list(data_list=data_list, table_name=self.__table_name)
+        with self.transaction():
+            self._cursor.executemany(INSERT_SQL, (self.__data_to_db(x) for x in data))
         logger.debug(f"[Database] Insert {len(data)} bangumi into database.")
 
     def update_one(self, data: BangumiData) -> bool:
         db_data = self.__data_to_db(data)
-        return self._update(db_data=db_data, table_name=self.__table_name)
+        self._cursor.execute(UPDATE_SQL, db_data)
+        self._commit()
+        return self._cursor.rowcount == 1
 
     def update_list(self, data: list[BangumiData]):
-        data_list = [self.__data_to_db(x) for x in data]
-        self._update_list(data_list=data_list, table_name=self.__table_name)
+        with self.transaction():
+            self._cursor.executemany(UPDATE_SQL, (self.__data_to_db(x) for x in data))
 
     @locked
     def update_rss(self, title_raw, rss_set: str):
@@ -80,7 +116,7 @@ class BangumiDatabase(DataConnector):
             """,
             {"rss_link": rss_set, "title_raw": title_raw},
         )
-        self._conn.commit()
+        self._commit()
         logger.debug(f"[Database] Update {title_raw} rss_link to {rss_set}.")
 
     def update_poster(self, title_raw, poster_link: str):
@@ -92,7 +128,7 @@ class BangumiDatabase(DataConnector):
             """,
             {"poster_link": poster_link, "title_raw": title_raw},
         )
-        self._conn.commit()
+        self._commit()
         logger.debug(f"[Database] Update {title_raw} poster_link to {poster_link}.")
 
     def delete_one(self, _id: int) -> bool:
@@ -102,7 +138,7 @@ class BangumiDatabase(DataConnector):
             """,
             {"id": _id},
         )
-        self._conn.commit()
+        self._commit()
         logger.debug(f"[Database] Delete bangumi id: {_id}.")
         return self._cursor.rowcount == 1
 
@@ -110,8 +146,17 @@ class BangumiDatabase(DataConnector):
         self._delete_all(self.__table_name)
 
     def search_all(self) -> list[BangumiData]:
-        dict_data = self._search_datas(self.__table_name)
-        return [self.__db_to_data(x) for x in dict_data]
+        return list(self.iter_all())
+
+    def iter_all(self) -> Iterator[BangumiData]:
+        # Own cursor, the shared one may be reused while the caller iterates
+        cursor = self._conn.cursor()
+        cursor.arraysize = FETCH_SIZE
+        cursor.execute("SELECT * FROM bangumi")
+        try:
+            yield from self.__iter_data(cursor)
+        finally:
+            cursor.close()
 
     def search_id(self, _id: int) -> BangumiData | None:
         condition = {"id": _id}
@@ -152,26 +197,65 @@ class BangumiDatabase(DataConnector):
         )
         if not match_datas:
             return torrent_list
+        # Scan each torrent name once for every title_raw instead of row by row
+        title_map = {}
+        for match_data in match_datas:
+            title_map.setdefault(match_data.get("title_raw"), match_data)
+        title_re = re.compile("|".join(re.escape(title) for title in title_map))
         # Match title
-        i = 0
-        while i < len(torrent_list):
-            torrent = torrent_list[i]
-            for match_data in match_datas:
-                if match_data.get("title_raw") in torrent.name:
-                    if rss_link not in match_data.get("rss_link"):
-                        match_data["rss_link"] += f",{rss_link}"
-                        self.update_rss(
-                            match_data.get("title_raw"), match_data.get("rss_link")
-                        )
-                    if not match_data.get("poster_link"):
-                        self.update_poster(
-                            match_data.get("title_raw"), torrent.poster_link
-                        )
-                    torrent_list.pop(i)
-                    break
-            else:
-                i += 1
-        return torrent_list
+        unmatched = []
+        rss_updates = []
+        poster_updates = []
+        for torrent in torrent_list:
+            match = title_re.search(torrent.name)
+            if match is None:
+                unmatched.append(torrent)
+                continue
+            match_data = title_map[match.group()]
+            if rss_link not in match_data.get("rss_link"):
+                match_data["rss_link"] += f",{rss_link}"
+                rss_updates.append(
+                    {
+                        "rss_link": match_data.get("rss_link"),
+                        "title_raw": match_data.get("title_raw"),
+                    }
+                )
+            if not match_data.get("poster_link"):
+                match_data["poster_link"] = torrent.poster_link
+                poster_updates.append(
+                    {
+                        "poster_link": match_data.get("poster_link"),
+                        "title_raw": match_data.get("title_raw"),
+                    }
+                )
+        if rss_updates or poster_updates:
+            self.__update_matched(rss_updates, poster_updates)
+        return unmatched
+
+    @locked
+    def __update_matched(self, rss_updates: list[dict], poster_updates: list[dict]):
+        # Flush rss / poster changes found by match_list in one transaction
+        with self.transaction():
+            self._cursor.executemany(
+                """
+                UPDATE bangumi 
+                SET rss_link = :rss_link, added = 0
+                WHERE title_raw = :title_raw
+                """,
+                rss_updates,
+            )
+            self._cursor.executemany(
+                """
+                UPDATE bangumi 
+                SET poster_link = :poster_link
+                WHERE title_raw = :title_raw
+                """,
+                poster_updates,
+            )
+        logger.debug(
+            f"[Database] Update {len(rss_updates)} rss_link, "
+            f"{len(poster_updates)} poster_link."
+        )
 
     def not_complete(self) -> list[BangumiData]:
         # Find eps_complete = False
@@ -194,13 +278,11 @@ class BangumiDatabase(DataConnector):
     def gen_id(self) -> int:
         self._cursor.execute(
             """
-            SELECT id FROM bangumi ORDER BY id DESC LIMIT 1
+            SELECT MAX(id) FROM bangumi
             """
         )
         data = self._cursor.fetchone()
-        if data is None:
-            return 1
-        return data[0] + 1
+        return (data[0] or 0) + 1
 
     def __check_exist(self, data: BangumiData):
         self._cursor.execute(
@@ -1,20 +1,67 @@
 import os
 import sqlite3
 import logging
+from contextlib import contextmanager
 
 
 from module.conf import DATA_PATH
 
 logger = logging.getLogger(__name__)
 
+# Exact type lookup, isinstance() would match bool as int
+SQLITE_TYPE_MAP = {
+    bool: "INTEGER NOT NULL",
+    int: "INTEGER NOT NULL",
+    float: "REAL NOT NULL",
+    str: "TEXT NOT NULL",
+    list: "TEXT NOT NULL",
+    type(None): "TEXT",
+}
+
 
 class DataConnector:
     def __init__(self):
         # Create folder if not exists
         if not os.path.exists(os.path.dirname(DATA_PATH)):
             os.makedirs(os.path.dirname(DATA_PATH))
-        self._conn = sqlite3.connect(DATA_PATH)
+        # Autocommit mode, multi-statement writes go through transaction()
+        self._conn = sqlite3.connect(
+            DATA_PATH, cached_statements=512, isolation_level=None
+        )
+        self._conn.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            PRAGMA temp_store = MEMORY;
+            PRAGMA cache_size = -20000;
+            PRAGMA mmap_size = 134217728;
+            """
+        )
+        self._conn.row_factory = sqlite3.Row
         self._cursor = self._conn.cursor()
+        self._transaction_depth = 0
+
+    @contextmanager
+    def transaction(self):
+        # Batch several statements into one commit, nested blocks join the outer one
+        if self._transaction_depth == 0 and not self._conn.in_transaction:
+            self._conn.execute("BEGIN IMMEDIATE")
+        self._transaction_depth += 1
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                if failed:
+                    self._conn.rollback()
+                else:
+                    self._conn.commit()
+
+    def _commit(self):
+        if self._transaction_depth == 0:
+            self._conn.commit()
 
     def _update_table(self, table_name: str, db_data: dict):
         columns = ", ".join(
@@ -32,11 +79,10 @@ class DataConnector:
         for key, value in db_data.items():
             if key not in existing_columns:
                 insert_column = self.__python_to_sqlite_type(value)
-                if value is None:
-                    value = "NULL"
-                add_column_sql = f"ALTER TABLE {table_name} ADD COLUMN {key} {insert_column} DEFAULT {value};"
+                default = self.__python_to_sqlite_literal(value)
+                add_column_sql = f"ALTER TABLE {table_name} ADD COLUMN {key} {insert_column} DEFAULT {default};"
                 self._cursor.execute(add_column_sql)
-        self._conn.commit()
+        self._commit()
         logger.debug(f"Create / Update table {table_name}.")
 
     def _insert(self, table_name: str, db_data: dict):
@@ -45,15 +91,15 @@ class DataConnector:
         self._cursor.execute(
             f"INSERT INTO {table_name} ({columns}) VALUES ({values})", db_data
         )
-        self._conn.commit()
+        self._commit()
 
     def _insert_list(self, table_name: str, data_list: list[dict]):
         columns = ", ".join(data_list[0].keys())
         values = ", ".join([f":{key}" for key in data_list[0].keys()])
-        self._cursor.executemany(
-            f"INSERT INTO {table_name} ({columns}) VALUES ({values})", data_list
-        )
-        self._conn.commit()
+        with self.transaction():
+            self._cursor.executemany(
+                f"INSERT INTO {table_name} ({columns}) VALUES ({values})", data_list
+            )
 
     def _select(self, keys: list[str], table_name: str, condition: str = None) -> dict:
         if condition is None:
@@ -72,7 +118,7 @@ class DataConnector:
         self._cursor.execute(
             f"UPDATE {table_name} SET {set_sql} WHERE id = {_id}", db_data
         )
-        self._conn.commit()
+        self._commit()
         return self._cursor.rowcount == 1
 
     def _update_list(self, table_name: str, data_list: list[dict]):
@@ -81,10 +127,10 @@ class DataConnector:
         set_sql = ", ".join(
             [f"{key} = :{key}" for key in data_list[0].keys() if key != "id"]
         )
-        self._cursor.executemany(
-            f"UPDATE {table_name} SET {set_sql} WHERE id = :id", data_list
-        )
-        self._conn.commit()
+        with self.transaction():
+            self._cursor.executemany(
+                f"UPDATE {table_name} SET {set_sql} WHERE id = :id", data_list
+            )
 
     def _update_section(self, table_name: str, location: dict, update_dict: dict):
         set_sql = ", ".join([f"{key} = :{key}" for key in update_dict.keys()])
@@ -92,18 +138,18 @@ class DataConnector:
         self._cursor.execute(
             f"UPDATE {table_name} SET {set_sql} WHERE {sql_loc}", update_dict
         )
-        self._conn.commit()
+        self._commit()
 
     def _delete_all(self, table_name: str):
         self._cursor.execute(f"DELETE FROM {table_name}")
-        self._conn.commit()
+        self._commit()
 
     def _delete(self, table_name: str, condition: dict):
         condition_sql = " AND ".join([f"{key} = :{key}" for key in condition.keys()])
         self._cursor.execute(
             f"DELETE FROM {table_name} WHERE {condition_sql}", condition
         )
-        self._conn.commit()
+        self._commit()
 
     def _search(
         self, table_name: str, keys: list[str] | None = None, condition: dict = None
@@ -126,19 +172,18 @@ class DataConnector:
 
     def _search_data(
         self, table_name: str, keys: list[str] | None = None, condition: dict = None
-    ) -> dict:
-        if keys is None:
-            keys = self.__get_table_columns(table_name)
+    ) -> dict | None:
         self._search(table_name, keys, condition)
-        return dict(zip(keys, self._cursor.fetchone()))
+        row = self._cursor.fetchone()
+        if row is None:
+            return None
+        return dict(row)
 
     def _search_datas(
         self, table_name: str, keys: list[str] | None = None, condition: dict = None
     ) -> list[dict]:
-        if keys is None:
-            keys = self.__get_table_columns(table_name)
         self._search(table_name, keys, condition)
-        return [dict(zip(keys, row)) for row in self._cursor.fetchall()]
+        return [dict(row) for row in self._cursor.fetchall()]
 
     def _table_exists(self, table_name: str) -> bool:
         self._cursor.execute(
@@ -147,26 +192,26 @@ class DataConnector:
         )
         return len(self._cursor.fetchall()) == 1
 
-    def __get_table_columns(self, table_name: str) -> list[str]:
-        self._cursor.execute(f"PRAGMA table_info({table_name})")
-        return [column_info[1] for column_info in self._cursor.fetchall()]
-
     @staticmethod
     def __python_to_sqlite_type(value) -> str:
-        if isinstance(value, int):
-            return "INTEGER NOT NULL"
-        elif isinstance(value, float):
-            return "REAL NOT NULL"
-        elif isinstance(value, str):
-            return "TEXT NOT NULL"
-        elif isinstance(value, bool):
-            return "INTEGER NOT NULL"
-        elif isinstance(value, list):
-            return "TEXT NOT NULL"
-        elif value is None:
-            return "TEXT"
-        else:
+        sqlite_type = SQLITE_TYPE_MAP.get(type(value))
+        if sqlite_type is None:
             raise ValueError(f"Unsupported data type: {type(value)}")
+        return sqlite_type
+
+    @staticmethod
+    def __python_to_sqlite_literal(value) -> str:
+        # DDL cannot take bound parameters, render DEFAULT values as SQL literals
+        if value is None:
+            return "NULL"
+        if isinstance(value, bool):
+            return str(int(value))
+        if isinstance(value, (int, float)):
+            return str(value)
+        if isinstance(value, list):
+            value = ",".join(value)
+        value = str(value).replace("'", "''")
+        return f"'{value}'"
 
     def __enter__(self):
         return self
@@ -44,4 +44,4 @@ class TorrentDatabase(DataConnector):
             f"INSERT INTO torrent ({columns}) VALUES ({values})", db_data
         )
         logger.debug(f"Add {data.torrent_name} into database.")
-        self._conn.commit()
+        self._commit()
@@ -39,8 +39,7 @@ class AuthDB(DataConnector):
         result = self._cursor.fetchone()
         if not result:
             return None
-        db_data = dict(zip([x[0] for x in self._cursor.description], result))
-        return self.__db_to_data(db_data)
+        return self.__db_to_data(dict(result))
 
     def auth_user(self, username, password) -> bool:
         self._cursor.execute(
@@ -65,7 +64,7 @@ class AuthDB(DataConnector):
             WHERE username = '{username}'
         """
         )
-        self._conn.commit()
+        self._commit()
 
 
 if __name__ == "__main__":
@@ -12,18 +12,18 @@ logger = logging.getLogger(__name__)
 
 class SeasonCollector(DownloadClient):
     def add_season_torrents(self, data: BangumiData, torrents, torrent_files=None):
+        save_path = self._gen_save_path(data)
         if torrent_files:
             download_info = {
                 "torrent_files": torrent_files,
-                "save_path": self._gen_save_path(data),
+                "save_path": save_path,
             }
-            return self.add_torrent(download_info)
         else:
             download_info = {
                 "urls": [torrent.torrent_link for torrent in torrents],
-                "save_path": self._gen_save_path(data),
+                "save_path": save_path,
             }
-            return self.add_torrent(download_info)
+        return self.add_torrent(download_info)
 
     def collect_season(self, data: BangumiData, link: str = None, proxy: bool = False):
         logger.info(f"Start collecting {data.official_title} Season {data.season}...")
@@ -41,6 +41,15 @@ class SeasonCollector(DownloadClient):
                 data=data, torrents=torrents, torrent_files=torrent_files
             )
 
+    def collect_seasons(self, datas: list[BangumiData]):
+        with SearchTorrent() as st:
+            season_torrents = st.search_seasons(datas)
+        for data, torrents in zip(datas, season_torrents):
+            logger.info(
+                f"Start collecting {data.official_title} Season {data.season}..."
+            )
+            self.add_season_torrents(data=data, torrents=torrents)
+
     def subscribe_season(self, data: BangumiData):
         with BangumiDatabase() as db:
             data.added = True
@@ -55,9 +64,8 @@ def eps_complete():
         datas = bd.not_complete()
         if datas:
             logger.info("Start collecting full season...")
+            with SeasonCollector() as sc:
+                sc.collect_seasons([data for data in datas if not data.eps_collect])
             for data in datas:
-                if not data.eps_collect:
-                    with SeasonCollector() as sc:
-                        sc.collect_season(data)
                 data.eps_collect = True
             bd.update_list(datas)
@@ -124,10 +124,7 @@ class TorrentManager(BangumiDatabase):
             )
 
     def search_all_bangumi(self):
-        datas = self.search_all()
-        if not datas:
-            return []
-        return [data for data in datas if not data.deleted]
+        return [data for data in self.iter_all() if not data.deleted]
 
     def search_one(self, _id: int | str):
         data = self.search_id(int(_id))
@@ -2,12 +2,15 @@ import re
 import xml.etree.ElementTree
 from dataclasses import dataclass
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from .request_url import RequestURL
 from .site import mikan_parser
 from module.conf import settings
 
+# Only the poster and title blocks of a mikan bangumi page are needed
+MIKAN_INFO_STRAINER = SoupStrainer(class_=re.compile(r"\bbangumi-(poster|title)\b"))
+
 
 @dataclass
 class TorrentInfo:
@@ -62,7 +65,7 @@ class RequestContent(RequestURL):
 
     def get_mikan_info(self, _url) -> tuple[str, str]:
         content = self.get_html(_url)
-        soup = BeautifulSoup(content, "html.parser")
+        soup = BeautifulSoup(content, "html.parser", parse_only=MIKAN_INFO_STRAINER)
         poster_div = soup.find("div", {"class": "bangumi-poster"})
         poster_style = poster_div.get("style")
         official_title = soup.select_one(
@@ -74,7 +77,7 @@ class RequestContent(RequestURL):
         return "", ""
 
     def get_xml(self, _url, retry: int = 3) -> xml.etree.ElementTree.Element:
-        return xml.etree.ElementTree.fromstring(self.get_url(_url, retry).text)
+        return xml.etree.ElementTree.fromstring(self.get_url(_url, retry).content)
 
     # API JSON
     def get_json(self, _url) -> dict:
@@ -4,6 +4,7 @@ import requests
 import socket
 import socks
 import logging
+from requests.adapters import HTTPAdapter
 
 from module.conf import settings
 
@@ -65,7 +66,7 @@ class RequestURL:
         if "://" not in url:
             url = f"http://{url}"
         try:
-            req = requests.head(url=url, headers=self.header, timeout=5)
+            req = self.session.head(url=url, headers=self.header, timeout=5)
             req.raise_for_status()
             return True
         except requests.RequestException as e:
@@ -74,6 +75,10 @@ class RequestURL:
 
     def __enter__(self):
         self.session = requests.Session()
+        # Keep-alive pool, a season collection fetches many files from one host
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         if settings.proxy.enable:
             if "http" in settings.proxy.type:
                 url = f"{settings.proxy.type}://{settings.proxy.host}:{settings.proxy.port}"
@@ -9,6 +9,8 @@ from module.conf import settings
 
 logger = logging.getLogger(__name__)
 
+TITLE_SEPARATOR_RE = re.compile(r"[/:.\\]")
+
 
 class RSSAnalyser:
     def __init__(self):
@@ -28,7 +30,7 @@ class RSSAnalyser:
             data.season = season
         else:
             pass
-        data.official_title = re.sub(r"[/:.\\]", " ", data.official_title)
+        data.official_title = TITLE_SEPARATOR_RE.sub(" ", data.official_title)
 
     @staticmethod
     def get_rss_torrents(rss_link: str, full_parse: bool = True) -> list:
@@ -43,9 +45,10 @@ class RSSAnalyser:
         self, torrents: list, rss_link: str, full_parse: bool = True
     ) -> list:
         new_data = []
+        new_titles = set()
         for torrent in torrents:
             data = self._title_analyser.raw_parser(raw=torrent.name, rss_link=rss_link)
-            if data and data.title_raw not in [i.title_raw for i in new_data]:
+            if data and data.title_raw not in new_titles:
                 try:
                     poster_link, mikan_title = (
                         torrent.poster_link,
@@ -58,6 +61,7 @@ class RSSAnalyser:
                 if not full_parse:
                     return [data]
                 new_data.append(data)
+                new_titles.add(data.title_raw)
                 logger.debug(f"[RSS] New title found: {data.official_title}")
         return new_data
 
@@ -2,10 +2,12 @@ import re
 
 from module.conf import settings
 
+SEARCH_STR_RE = re.compile(r"[\W_ ]")
+
 
 def mikan_url(keywords: list[str]):
     keyword = "+".join(keywords)
-    search_str = re.sub(r"[\W_ ]", "+", keyword)
+    search_str = SEARCH_STR_RE.sub("+", keyword)
     url = f"{settings.rss_parser.custom_url}/RSS/Search?searchstr={search_str}"
     if "://" not in url:
         url = f"https://{url}"
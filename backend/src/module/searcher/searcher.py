@@ -1,3 +1,7 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from module.searcher.plugin import search_url
 from module.network import RequestContent
 from module.models import BangumiData, TorrentBase
@@ -11,12 +15,45 @@ SEARCH_KEY = [
     "dpi",
 ]
 
+# Concurrent searches against one site, kept below the session pool size
+SEARCH_WORKERS = 8
+
+# Search results by url, reused for a while within a long-running process
+SEARCH_CACHE_TTL = 300
+SEARCH_CACHE_SIZE = 256
+search_cache: dict[str, tuple[float, list[TorrentBase]]] = {}
+search_cache_lock = threading.Lock()
+
+
+def get_cached_search(url: str) -> list[TorrentBase] | None:
+    with search_cache_lock:
+        cached = search_cache.get(url)
+        if cached is None:
+            return None
+        cached_time, torrents = cached
+        if time.monotonic() - cached_time > SEARCH_CACHE_TTL:
+            del search_cache[url]
+            return None
+        return list(torrents)
+
+
+def set_cached_search(url: str, torrents: list[TorrentBase]):
+    with search_cache_lock:
+        search_cache.pop(url, None)
+        if len(search_cache) >= SEARCH_CACHE_SIZE:
+            # Dicts keep insertion order, the first entry is the oldest
+            del search_cache[next(iter(search_cache))]
+        search_cache[url] = (time.monotonic(), list(torrents))
+
 
 class SearchTorrent(RequestContent):
     def search_torrents(
         self, keywords: list[str], site: str = "mikan"
     ) -> list[TorrentBase]:
         url = search_url(site, keywords)
+        cached = get_cached_search(url)
+        if cached is not None:
+            return cached
         # TorrentInfo to TorrentBase
         torrents = self.get_torrents(url)
 
@@ -28,13 +65,22 @@ class SearchTorrent(RequestContent):
                     "homepage": torrent.homepage,
                 }
 
-        return [TorrentBase(**d) for d in to_dict()]
+        results = [TorrentBase(**d) for d in to_dict()]
+        # Empty results may be a failed request, fetch again next time
+        if results:
+            set_cached_search(url, results)
+        return results
 
     def search_season(self, data: BangumiData):
         keywords = [getattr(data, key) for key in SEARCH_KEY if getattr(data, key)]
         torrents = self.search_torrents(keywords)
         return [torrent for torrent in torrents if data.title_raw in torrent.name]
 
+    def search_seasons(self, datas: list[BangumiData]) -> list[list[TorrentBase]]:
+        # Requests are I/O bound, fan them out over the shared session
+        with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as executor:
+            return list(executor.map(self.search_season, datas))
+
 
 if __name__ == "__main__":
     with SearchTorrent() as st:
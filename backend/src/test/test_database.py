@@ -0,0 +1,90 @@
+import pytest
+
+from module.database import BangumiDatabase, connector
+from module.database.connector import DataConnector
+from module.models import BangumiData
+from module.network import TorrentInfo
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(connector, "DATA_PATH", str(tmp_path / "data.db"))
+    with BangumiDatabase() as database:
+        database.update_table()
+        yield database
+
+
+def make_torrent(name: str) -> TorrentInfo:
+    return TorrentInfo(
+        name=name,
+        torrent_link="https://mikanani.me/Download/test.torrent",
+        homepage="https://mikanani.me/Home/Episode/test",
+        _poster_link="/images/Bangumi/test.jpg",
+        _official_title="official",
+    )
+
+
+def test_match_list(db):
+    db.insert_list(
+        [
+            BangumiData(official_title="Long", title_raw="Kimi no Na", rss_link=["a"]),
+            BangumiData(official_title="Short", title_raw="Na", rss_link=["a"]),
+            BangumiData(
+                official_title="Meta",
+                title_raw="Re:Zero (S2) [v2]",
+                rss_link=["a"],
+                poster_link="/images/Bangumi/meta.jpg",
+            ),
+        ]
+    )
+    torrents = [
+        make_torrent("[Group] Kimi no Na - 01 [1080p]"),
+        make_torrent("[Group] Re:Zero (S2) [v2] - 02 [1080p]"),
+        make_torrent("[Group] Re:Zero S2 v2 - 02 [1080p]"),
+        make_torrent("[Group] Unknown - 03 [1080p]"),
+    ]
+    statements = []
+    db._conn.set_trace_callback(statements.append)
+    unmatched = db.match_list(torrents, "b")
+    db._conn.set_trace_callback(None)
+
+    # Metacharacters are matched literally, unknown names are returned
+    assert [t.name for t in unmatched] == [
+        "[Group] Re:Zero S2 v2 - 02 [1080p]",
+        "[Group] Unknown - 03 [1080p]",
+    ]
+    # The leftmost title in the name wins, "Na" inside it is not touched
+    data = {d.title_raw: d for d in db.search_all()}
+    assert data["Kimi no Na"].rss_link == ["a", "b"]
+    assert data["Kimi no Na"].poster_link == "/images/Bangumi/test.jpg"
+    assert data["Na"].rss_link == ["a"]
+    assert data["Na"].poster_link is None
+    assert data["Re:Zero (S2) [v2]"].rss_link == ["a", "b"]
+    assert data["Re:Zero (S2) [v2]"].poster_link == "/images/Bangumi/meta.jpg"
+    # rss and poster updates are written in a single transaction
+    assert statements.count("BEGIN IMMEDIATE") == 1
+    assert statements.count("COMMIT") == 1
+
+
+def test_update_table_add_columns(tmp_path, monkeypatch):
+    monkeypatch.setattr(connector, "DATA_PATH", str(tmp_path / "data.db"))
+    with DataConnector() as db:
+        db._update_table("test", {"id": 0})
+        db._insert("test", {"id": 1})
+        db._update_table(
+            "test",
+            {
+                "id": 0,
+                "name": "It's [S2]",
+                "poster_link": None,
+                "added": True,
+                "rss_link": ["a", "b"],
+            },
+        )
+        assert db._search_data("test", condition={"id": 1}) == {
+            "id": 1,
+            "name": "It's [S2]",
+            "poster_link": None,
+            "added": 1,
+            "rss_link": "a,b",
+        }
@@ -0,0 +1,19 @@
+from unittest import mock
+
+from module.network import RequestContent
+
+
+def test_get_mikan_info():
+    content = """
+    <html><body>
+    <div class="bangumi-poster div-hover" style="background-image: url('/images/Bangumi/202304/test.jpg?width=400');"></div>
+    <p class="bangumi-title">
+        <a href="/Home/Bangumi/3015" target="_blank">我推的孩子</a>
+        <a href="/RSS/Bangumi?bangumiId=3015" class="mikan-rss"></a>
+    </p>
+    </body></html>
+    """
+    with mock.patch.object(RequestContent, "get_html", return_value=content):
+        poster_link, official_title = RequestContent().get_mikan_info("url")
+    assert poster_link == "/images/Bangumi/202304/test.jpg?width=400"
+    assert official_title == "我推的孩子"